@@ -0,0 +1,33 @@
+from unitscalar import UnitScalar as us
+import numpy as np
+import time
+
+################################################################################
+#                     Bulk Quantity Literal Parsing Throughput
+################################################################################
+
+# Times UnitScalar.parse_array() on a column of quantity literals, as read from a
+# CSV or configuration file, with one shared unit and with mixed (equivalent)
+# units per cell. Numbers have three decimals, like typical measurement data
+
+N_CELLS = 1_000_000
+rng = np.random.default_rng(0)
+numbers = rng.uniform(0, 100, N_CELLS).round(3)
+
+
+def bench(name: str, cells: np.ndarray) -> None:
+    start = time.perf_counter()
+    us.UnitScalar.parse_array(cells)
+    elapsed = time.perf_counter() - start
+    print(f"{name:>14}: {N_CELLS / elapsed:12,.0f} cells/s")
+
+
+bench("single unit", np.char.add(numbers.astype(str), " kPa"))
+bench(
+    "mixed units",
+    np.char.add(
+        np.char.add(numbers.astype(str), " "),
+        rng.choice(["psi", "kPa", "bar", "N/mm2", "atm"], N_CELLS),
+    ),
+)
+bench("temperatures", np.char.add(numbers.astype(str), " degF"))
@@ -0,0 +1,61 @@
+from unitscalar import UnitScalar as us
+from concurrent.futures import ThreadPoolExecutor
+import os
+import sys
+import threading
+import time
+
+################################################################################
+#                     Multi-Threaded Stress/Throughput Test
+################################################################################
+
+# Hammers the shared unit parse cache and unit metadata from many threads at
+# once, checking every result, and reports throughput per thread count. Threads
+# only scale across cores on a free-threaded (no GIL) build, e.g. python3.13t.
+# The thread count doubles up to the CPU count, or up to the first argument:
+#
+#   python3.13t examples/thread_scaling.py [MAX_THREADS]
+
+OPS_PER_THREAD = 20_000
+UNIT_STRS = ["m/s", "kg m/s2", "kPa", "J/kg degC", "mm(1/2)", "lbf", "Wh", "psi"]
+
+
+def worker(barrier: threading.Barrier) -> int:
+    barrier.wait()
+    for i in range(OPS_PER_THREAD):
+        unit_str = UNIT_STRS[i % len(UNIT_STRS)]
+        x = us.UnitScalar(4.0, unit_str)
+        y = (x * x).sqrt()
+        assert y.units_agree(unit_str), f"Units corrupted: {y.units()} vs {unit_str}"
+        assert abs(y.to_units(unit_str) - 4.0) < 1e-9, "Value corrupted"
+        assert (x - x).units_agree(x), "Units corrupted by subtraction"
+    return OPS_PER_THREAD
+
+
+def run(n_threads: int) -> float:
+    barrier = threading.Barrier(n_threads + 1)
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        futures = [pool.submit(worker, barrier) for _ in range(n_threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        total = sum(f.result() for f in futures)
+        elapsed = time.perf_counter() - start
+    return total / elapsed
+
+
+gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+print(
+    f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}"
+)
+
+max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+n_threads = 1
+baseline = None
+while n_threads <= max_threads:
+    throughput = run(n_threads)
+    baseline = baseline or throughput
+    print(
+        f"{n_threads:3d} threads: {throughput:12,.0f} ops/s "
+        f"({throughput / baseline:.2f}x single-threaded)"
+    )
+    n_threads *= 2
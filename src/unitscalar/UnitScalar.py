@@ -1,111 +1,299 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from custom_literals import literals, lie, rename
-import copy
+from fractions import Fraction
+from types import MappingProxyType
+from typing import Iterable, Sequence
 import math
 import numbers as nums
 import numpy as np
+import re
 
 
 @literals(float, int)
 class UnitScalar(lie(float)):
-    VALID_UNITS = {
-        # Unit (SI unit numerator, SI unit denominator, multiple)
-        "m": ("m", "", 1.0),
-        "s": ("s", "", 1.0),
-        "kg": ("kg", "", 1.0),
-        "C": ("C", "", 1.0),
-        "K": ("K", "", 1.0),
-        "in": ("m", "", 0.0254),
-        "L": ("m3", "", 1e-3),
-        "Hz": ("1", "s", 1.0),
-        "rpm": ("1", "s", 1 / 60),
-        "g": ("kg", "", 1e-3),
-        "lbm": ("kg", "", 0.45359237),
-        "J": ("kg m2", "s2", 1.0),
-        "Wh": ("J", "", 3600.0),
-        # Molarity is *technically* not an SI unit, but it messes with
-        # FP-precision to be multiplying/dividing by 6.02214076e23
-        # "mol": ("", "", 6.02214076e23),
-        "mol": ("mol", "", 1.0),
-        "N": ("kg m", "s2", 1.0),
-        "lbf": ("kg m", "s2", 9.80665 * 0.45359237),
-        "Pa": ("N", "m2", 1.0),
-        "hPa": ("N", "m2", 1e2),  # Hectopascal
-        "bar": ("N", "m2", 1e5),
-        "atm": ("N", "m2", 101325.0),  # Atmosphere
-        "psi": ("N", "m2", 9.80665 * 0.45359237 / (0.0254**2)),
-        "W": ("J", "s", 1.0),
-        "Ah": ("C", "", 3600.0),  # Amp-Hour
-        "A": ("C", "s", 1.0),
-        "V": ("J", "C", 1.0),
-        "ohm": ("V", "A", 1.0),
-        "T": ("V s", "m2", 1.0),  # Tesla
-        "F": ("C", "V", 1.0),  # Farad
-        "H": ("m2 kg", "C2", 1.0),  # Henry
-    }
-
-    VALID_PREFIXES = {
-        "f": 1e-15,  # femto
-        "p": 1e-12,  # pico
-        "n": 1e-9,  # nano
-        "u": 1e-6,  # micro
-        "m": 1e-3,  # milli
-        "c": 1e-2,  # centi (mostly just for cm)
-        "k": 1e3,  # kilo
-        "M": 1e6,  # mega
-        "G": 1e9,  # giga
-        "T": 1e12,  # tera
-    }
-
-    # Fundamental data type stored in the num_unit, den_unit lists
-    @dataclass
+    # Unit metadata is read-only (MappingProxyType) so it can be shared freely
+    # between threads, and so cached unit parses can never go stale
+    VALID_UNITS = MappingProxyType(
+        {
+            # Unit (SI unit numerator, SI unit denominator, multiple)
+            "m": ("m", "", 1.0),
+            "s": ("s", "", 1.0),
+            "kg": ("kg", "", 1.0),
+            "C": ("C", "", 1.0),
+            "K": ("K", "", 1.0),
+            # Offset temperature scales. Alone, these are absolute temperatures (see
+            # OFFSET_UNITS); inside a compound unit, e.g. "J/kg degC", they only scale
+            "degC": ("K", "", 1.0),
+            "degF": ("K", "", 5 / 9),
+            "delta_degC": ("K", "", 1.0),  # Temperature difference in Celsius
+            "delta_degF": ("K", "", 5 / 9),  # Temperature difference in Fahrenheit
+            "in": ("m", "", 0.0254),
+            "L": ("m3", "", 1e-3),
+            "Hz": ("1", "s", 1.0),
+            "rpm": ("1", "s", 1 / 60),
+            "g": ("kg", "", 1e-3),
+            "lbm": ("kg", "", 0.45359237),
+            "J": ("kg m2", "s2", 1.0),
+            "Wh": ("J", "", 3600.0),
+            # Molarity is *technically* not an SI unit, but it messes with
+            # FP-precision to be multiplying/dividing by 6.02214076e23
+            # "mol": ("", "", 6.02214076e23),
+            "mol": ("mol", "", 1.0),
+            "N": ("kg m", "s2", 1.0),
+            "lbf": ("kg m", "s2", 9.80665 * 0.45359237),
+            "Pa": ("N", "m2", 1.0),
+            "hPa": ("N", "m2", 1e2),  # Hectopascal
+            "bar": ("N", "m2", 1e5),
+            "atm": ("N", "m2", 101325.0),  # Atmosphere
+            "psi": ("N", "m2", 9.80665 * 0.45359237 / (0.0254**2)),
+            "W": ("J", "s", 1.0),
+            "Ah": ("C", "", 3600.0),  # Amp-Hour
+            "A": ("C", "s", 1.0),
+            "V": ("J", "C", 1.0),
+            "ohm": ("V", "A", 1.0),
+            "T": ("V s", "m2", 1.0),  # Tesla
+            "F": ("C", "V", 1.0),  # Farad
+            "H": ("m2 kg", "C2", 1.0),  # Henry
+        }
+    )
+
+    VALID_PREFIXES = MappingProxyType(
+        {
+            "f": 1e-15,  # femto
+            "p": 1e-12,  # pico
+            "n": 1e-9,  # nano
+            "u": 1e-6,  # micro
+            "m": 1e-3,  # milli
+            "c": 1e-2,  # centi (mostly just for cm)
+            "k": 1e3,  # kilo
+            "M": 1e6,  # mega
+            "G": 1e9,  # giga
+            "T": 1e12,  # tera
+        }
+    )
+
+    # Zero points of the offset units, in the unit's own scale. A value x in one of
+    # these units is (x + offset) * multiple in SI units
+    OFFSET_UNITS = MappingProxyType(
+        {
+            "degC": 273.15,
+            "degF": 459.67,
+        }
+    )
+
+    # Dimension signature of a temperature, see UnitScalar._dimension
+    _TEMPERATURE = (("K", 1, 1),)
+
+    # Largest exponent denominator accepted when converting a float power (e.g.
+    # 0.5, 1 / 3) into an exact rational exponent
+    MAX_EXP_DENOMINATOR = 100
+
+    # Splits a unit string on "/", ignoring any slash inside a parenthesized
+    # rational exponent, e.g. "m(1/2) / s"
+    _FRACTION_SPLIT = re.compile(r"/(?![^(]*\))")
+    # A rational exponent, which must be parenthesized, e.g. "(1/2)" or "(-3/2)"
+    _RATIONAL_EXP = re.compile(r"^\((-?\d+)(?:/(\d+))?\)$")
+
+    # Maximum number of distinct unit strings kept in the parse cache
+    PARSE_CACHE_SIZE = 4096
+
+    # Unit string -> (numerator units, denominator units, multiple, dimension),
+    # see UnitScalar._parse_units_cached. Entries are immutable and never
+    # replaced, so lookups and inserts need no lock, with or without the GIL
+    _PARSE_CACHE = {}
+
+    # (numerator units, denominator units) -> dimension signature, see
+    # UnitScalar._dimension. Shares the parse cache's size limit and lock-free
+    # insertion
+    _DIMENSION_CACHE = {}
+
+    # Fundamental data type stored in the num_unit, den_unit lists. Immutable, so
+    # lists of these can be shallow-copied and shared between UnitScalars
+    @dataclass(frozen=True)
     class SimpleUnit:
         unit: str  # Must be a member of UnitScalar.VALID_UNITS
-        exp: int
+        exp: int | Fraction  # Rational exponents arise from fractional powers
+
+        # Whole-number exponents are always stored as ints
+        def __post_init__(self) -> None:
+            if type(self.exp) is Fraction and self.exp.denominator == 1:
+                object.__setattr__(self, "exp", int(self.exp))
 
     # Simplify the unit fraction, without substitution of complex units
     @staticmethod
     def _reduce_units(
         num_units: list[UnitScalar.SimpleUnit], den_units: list[UnitScalar.SimpleUnit]
     ) -> tuple[list[UnitScalar.SimpleUnit], list[UnitScalar.SimpleUnit]]:
-        i = 0
-        while i < len(num_units):
-            j = 0
-            while j < len(den_units):
-                if num_units[i].unit == den_units[j].unit:
-                    if num_units[i].exp > den_units[j].exp:
-                        num_units[i].exp = num_units[i].exp - den_units[j].exp
-                        del den_units[j]
-                    elif num_units[i].exp == den_units[j].exp:
-                        del den_units[j]
-                        del num_units[i]
-                        i -= 1
+        num_out = []
+        den_out = list(den_units)
+        for x in num_units:
+            for j, y in enumerate(den_out):
+                if x.unit == y.unit:
+                    if x.exp > y.exp:
+                        x = UnitScalar.SimpleUnit(x.unit, x.exp - y.exp)
+                        del den_out[j]
+                    elif x.exp == y.exp:
+                        x = None
+                        del den_out[j]
                     else:
-                        den_units[j].exp = den_units[j].exp - num_units[i].exp
-                        del num_units[i]
-                        i -= 1
-                j += 1
-            i += 1
-        return num_units, den_units
+                        den_out[j] = UnitScalar.SimpleUnit(y.unit, y.exp - x.exp)
+                        x = None
+                    break
+            if x is not None:
+                num_out.append(x)
+        return num_out, den_out
 
     # Merge lists of SimpleUnit, taking care to not duplicate entries
     @staticmethod
     def _merge_lists(
         la: list[UnitScalar.SimpleUnit], lb: list[UnitScalar.SimpleUnit]
     ) -> list[UnitScalar.SimpleUnit]:
-        out = copy.deepcopy(la)
+        out = list(la)
         for x in lb:
-            located = False
-            for y in out:
+            for i, y in enumerate(out):
                 if y.unit == x.unit:
-                    y.exp += x.exp
-                    located = True
+                    out[i] = UnitScalar.SimpleUnit(y.unit, y.exp + x.exp)
                     break
-            if not located:
-                out.append(copy.deepcopy(x))
+            else:
+                out.append(x)
         return out
 
+    # Convert a power into an exact rational exponent. Floats are snapped to the
+    # nearest fraction with a small denominator, so 0.5 becomes 1/2 and 1 / 3
+    # becomes 1/3
+    @staticmethod
+    def _to_exponent(power: nums.Real) -> int | Fraction:
+        if isinstance(power, nums.Integral):
+            return int(power)
+        exp = Fraction(power).limit_denominator(UnitScalar.MAX_EXP_DENOMINATOR)
+        if not math.isclose(float(exp), float(power), rel_tol=1e-9):
+            raise Exception(f"Power {power} is not a simple rational exponent")
+        return int(exp) if exp.denominator == 1 else exp
+
+    # Canonical dimension signature of a unit fraction: a sorted tuple of
+    # (unit, exponent numerator, exponent denominator) with the denominator units
+    # folded in as negative exponents. Two unit fractions are equivalent exactly
+    # when their signatures are equal, which is a plain tuple comparison. Memoized
+    # per unit fraction, as the same few come up over and over in arithmetic
+    @staticmethod
+    def _dimension(
+        num_units: list[UnitScalar.SimpleUnit], den_units: list[UnitScalar.SimpleUnit]
+    ) -> tuple[tuple[str, int, int], ...]:
+        key = (tuple(num_units), tuple(den_units))
+        cached = UnitScalar._DIMENSION_CACHE.get(key)
+        if cached is None:
+            cached = UnitScalar._compute_dimension(num_units, den_units)
+            if len(UnitScalar._DIMENSION_CACHE) < UnitScalar.PARSE_CACHE_SIZE:
+                cached = UnitScalar._DIMENSION_CACHE.setdefault(key, cached)
+        return cached
+
+    @staticmethod
+    def _compute_dimension(
+        num_units: list[UnitScalar.SimpleUnit], den_units: list[UnitScalar.SimpleUnit]
+    ) -> tuple[tuple[str, int, int], ...]:
+        net = {}
+        for x in num_units:
+            net[x.unit] = net.get(x.unit, 0) + x.exp
+        for x in den_units:
+            net[x.unit] = net.get(x.unit, 0) - x.exp
+        return tuple(
+            sorted(
+                (unit, exp.numerator, exp.denominator)
+                for unit, exp in net.items()
+                if exp != 0
+            )
+        )
+
+    # Zero-point offset of a unit string, which is nonzero only when the string is
+    # a lone offset unit (e.g. "degC", but not "J/degC")
+    @staticmethod
+    def _unit_offset(unit_str: str) -> float:
+        return UnitScalar.OFFSET_UNITS.get(unit_str.strip(), 0.0)
+
+    # Whether a unit string is a lone temperature difference unit, e.g. "delta_degC"
+    @staticmethod
+    def _is_delta_unit(unit_str: str) -> bool:
+        return unit_str.strip() in (f"delta_{x}" for x in UnitScalar.OFFSET_UNITS)
+
+    # Whether a product/quotient of a and b is still a temperature difference,
+    # i.e. a is one and b is dimensionless (scaling a difference keeps it one)
+    @staticmethod
+    def _scaled_delta(a: UnitScalar, b: UnitScalar) -> bool:
+        return a.temp_delta and UnitScalar._dimension(b.num_unit, b.den_unit) == ()
+
+    # Whether the difference a - b is a temperature difference rather than an
+    # absolute temperature. Two absolute temperatures differ by a delta, while an
+    # absolute temperature minus a delta is still absolute
+    @staticmethod
+    def _difference_is_delta(a: UnitScalar, b: UnitScalar) -> bool:
+        if a.temp_delta and not b.temp_delta:
+            raise Exception(
+                "Cannot subtract an absolute temperature from a temperature difference"
+            )
+        return a.temp_delta == b.temp_delta and (
+            a.temp_delta
+            or UnitScalar._dimension(a.num_unit, a.den_unit) == UnitScalar._TEMPERATURE
+        )
+
+    # Whether the sum a + b is a temperature difference. A difference added to an
+    # absolute temperature is still absolute, while two absolute temperatures
+    # cannot be added at all
+    @staticmethod
+    def _sum_is_delta(a: UnitScalar, b: UnitScalar) -> bool:
+        if (
+            not (a.temp_delta or b.temp_delta)
+            and UnitScalar._dimension(a.num_unit, a.den_unit) == UnitScalar._TEMPERATURE
+        ):
+            raise Exception(
+                "Cannot add two absolute temperatures, add a temperature difference"
+            )
+        return a.temp_delta and b.temp_delta
+
+    # Vectorized conversion of raw numbers (scalar or array) between two
+    # equivalent unit strings, including offset units, without building any
+    # UnitScalar objects, e.g. UnitScalar.convert(celsius_array, "degC", "degF")
+    @staticmethod
+    def convert(
+        values: nums.Real | np.ndarray, from_units: str, to_units: str
+    ) -> float | np.ndarray:
+        src = UnitScalar._parse_units_cached(from_units)
+        dst = UnitScalar._parse_units_cached(to_units)
+        if src[3] != dst[3]:
+            raise Exception("Target units not equivalent with source units!")
+        if UnitScalar._is_delta_unit(from_units) and UnitScalar._unit_offset(to_units):
+            raise Exception(
+                f'Temperature difference cannot be expressed in "{to_units}", '
+                f'use "delta_{to_units.strip()}"'
+            )
+        if UnitScalar._is_delta_unit(to_units) and not UnitScalar._is_delta_unit(
+            from_units
+        ):
+            raise Exception(
+                f'Absolute temperature cannot be expressed in "{to_units}", '
+                "subtract a reference temperature first"
+            )
+        if not isinstance(values, nums.Real):
+            values = np.asarray(values, dtype=np.float64)
+
+        # (x + from_offset) * scale - to_offset, folded into one multiply-add
+        scale = src[2] / dst[2]
+        bias = UnitScalar._unit_offset(from_units) * scale - UnitScalar._unit_offset(
+            to_units
+        )
+        return values * scale + bias
+
+    # Format a single SimpleUnit, wrapping fractional exponents in parentheses
+    # so the result can be parsed back, e.g. "m(1/2)"
+    @staticmethod
+    def _format_unit(unit: UnitScalar.SimpleUnit) -> str:
+        if unit.exp == 1:
+            return unit.unit
+        elif Fraction(unit.exp).denominator == 1:
+            return f"{unit.unit}{int(unit.exp)}"
+        else:
+            return f"{unit.unit}({Fraction(unit.exp)})"
+
     # Parse complicated unit string, e.g. "kg mm / ms2", into a list of base SI units
     # for the numerator and denominator, and a multiplication factor combining all
     # unit prefixes together
@@ -113,7 +301,7 @@ class UnitScalar(lie(float)):
     def _parse_units(
         unit_str: str,
     ) -> tuple[list[UnitScalar.SimpleUnit], list[UnitScalar.SimpleUnit], float]:
-        split = unit_str.split("/")
+        split = UnitScalar._FRACTION_SPLIT.split(unit_str)
         num_str = split[0] if len(split) > 0 else ""
         den_str = split[1] if len(split) > 1 else ""
         num_unit_strs = num_str.split(" ")
@@ -139,10 +327,11 @@ class UnitScalar(lie(float)):
             den_units = []
             mult = 1.0
 
-            # Find first number in the string (exponent). Mark None if does not exist
+            # Find first number in the string (exponent), or the opening parenthesis
+            # of a rational exponent. Mark None if does not exist
             # https://stackoverflow.com/a/22446407/3339274
             for idx_first_num, c in enumerate(unit_str):
-                if c.isdigit():
+                if c.isdigit() or c == "(":
                     break
             else:
                 idx_first_num = len(unit_str)
@@ -162,10 +351,17 @@ class UnitScalar(lie(float)):
             # Apply unit multiple
             mult *= unit[2]
 
-            # Break out the exponent as an integer
+            # Break out the exponent as an integer, or a fraction if given in
+            # parentheses, e.g. "m(1/2)"
             exp = None
-            if idx_first_num != len(unit_str):
-                exp = int(unit_str[idx_first_num:])
+            exp_str = unit_str[idx_first_num:]
+            rational = UnitScalar._RATIONAL_EXP.match(exp_str)
+            if rational is not None:
+                exp = UnitScalar._to_exponent(
+                    Fraction(int(rational[1]), int(rational[2] or 1))
+                )
+            elif exp_str != "":
+                exp = int(exp_str)
             else:
                 exp = 1
 
@@ -184,10 +380,12 @@ class UnitScalar(lie(float)):
                     f"{unit[0]} / {unit[1]}"
                 )
                 # Apply outer exponent to all inner terms
-                for unit in num_units:
-                    unit.exp *= exp
-                for unit in den_units:
-                    unit.exp *= exp
+                num_units = [
+                    UnitScalar.SimpleUnit(x.unit, x.exp * exp) for x in num_units
+                ]
+                den_units = [
+                    UnitScalar.SimpleUnit(x.unit, x.exp * exp) for x in den_units
+                ]
                 mult *= mult_inner
 
             mult = mult**exp
@@ -221,18 +419,128 @@ class UnitScalar(lie(float)):
         # num_unit_list, den_unit_list = UnitScalar.reduce_units(num_unit_list, den_unit_list)
         return num_unit_list, den_unit_list, units_mult
 
+    # Parse and reduce a unit string, memoized. Two threads missing on the same
+    # string may both parse it, but setdefault() makes them agree on one entry
+    @staticmethod
+    def _parse_units_cached(unit_str: str) -> tuple[
+        tuple[UnitScalar.SimpleUnit, ...],
+        tuple[UnitScalar.SimpleUnit, ...],
+        float,
+        tuple[tuple[str, int, int], ...],
+    ]:
+        cached = UnitScalar._PARSE_CACHE.get(unit_str)
+        if cached is None:
+            num_units, den_units, mult = UnitScalar._parse_units(unit_str)
+            num_units, den_units = UnitScalar._reduce_units(num_units, den_units)
+            cached = (
+                tuple(num_units),
+                tuple(den_units),
+                mult,
+                UnitScalar._dimension(num_units, den_units),
+            )
+            if len(UnitScalar._PARSE_CACHE) < UnitScalar.PARSE_CACHE_SIZE:
+                cached = UnitScalar._PARSE_CACHE.setdefault(unit_str, cached)
+        return cached
+
     def __init__(self, num: nums.Real | np.ndarray, unit: str) -> None:
-        self.num_unit, self.den_unit, units_mult = UnitScalar._parse_units(unit)
-        self.num_unit, self.den_unit = UnitScalar._reduce_units(
-            self.num_unit, self.den_unit
-        )
-        self.num = num * units_mult
+        num_unit, den_unit, units_mult, _ = UnitScalar._parse_units_cached(unit)
+        self.num_unit, self.den_unit = list(num_unit), list(den_unit)
+        self.num = (num + UnitScalar._unit_offset(unit)) * units_mult
+        # Set on temperature differences, which cannot be expressed in an absolute
+        # offset unit such as "degC"
+        self.temp_delta = UnitScalar._is_delta_unit(unit)
+
+    # Split a quantity literal into its number and unit string, which are
+    # separated by any whitespace (spaces, tabs, ...)
+    @staticmethod
+    def _split_quantity(quantity: str) -> tuple[float, str]:
+        split = quantity.split(None, 1)
+        try:
+            num = float(split[0])
+        except (IndexError, ValueError):
+            raise ValueError(
+                f'Quantity "{quantity}" is not a number followed by whitespace and '
+                "a unit string"
+            ) from None
+        return num, " ".join(split[1].split()) if len(split) > 1 else ""
+
+    # Parse a quantity literal such as "3.2 kPa" or "1.2e3 kg m/s2"
+    @classmethod
+    def parse(cls, quantity: str) -> UnitScalar:
+        return cls(*UnitScalar._split_quantity(quantity))
+
+    # Parse an iterable or ndarray of quantity literals into one array-valued
+    # UnitScalar. Numbers are split off and converted by numpy in bulk, and each
+    # distinct unit string is parsed only once, so cells may mix equivalent
+    # units, e.g. ["10 psi", "3.2 kPa"]
+    @classmethod
+    def parse_array(cls, quantities: Iterable[str] | np.ndarray) -> UnitScalar:
+        # numpy would wrap a generator/iterator as a single 0-d element
+        if not isinstance(quantities, (np.ndarray, Sequence)):
+            quantities = list(quantities)
+        quantities = np.asarray(quantities, dtype=str)
+        if quantities.size == 0:
+            return cls(np.zeros(quantities.shape), "")
+        quantities = np.char.strip(quantities)
+        parts = np.char.partition(quantities, " ")
+        try:
+            # float() on a list is quicker than numpy's str -> float64 cast
+            values = np.fromiter(
+                map(float, parts[..., 0].ravel().tolist()),
+                dtype=np.float64,
+                count=quantities.size,
+            ).reshape(quantities.shape)
+            unit_strs = parts[..., 2]
+        except ValueError:
+            # Some cells are not separated by a single space (e.g. tabs), so split
+            # them one by one instead
+            split = [UnitScalar._split_quantity(x) for x in quantities.ravel().tolist()]
+            values = np.array([x[0] for x in split]).reshape(quantities.shape)
+            unit_strs = np.array([x[1] for x in split]).reshape(quantities.shape)
+
+        # Most columns share a single unit string, which skips indexing them all
+        if (unit_strs == unit_strs.flat[0]).all():
+            distinct, inverse = [unit_strs.flat[0]], None
+        else:
+            codes = {}
+            inverse = np.fromiter(
+                (codes.setdefault(x, len(codes)) for x in unit_strs.ravel().tolist()),
+                dtype=np.intp,
+                count=quantities.size,
+            ).reshape(quantities.shape)
+            distinct = list(codes)
+        # Normalize whitespace within the (few) distinct unit strings
+        distinct = [" ".join(x.split()) for x in distinct]
+
+        parsed = [UnitScalar._parse_units_cached(x) for x in distinct]
+        for unit_str, entry in zip(distinct, parsed):
+            if entry[3] != parsed[0][3]:
+                raise Exception(
+                    f'Units "{unit_str}" and "{distinct[0]}" are not equivalent'
+                )
+        deltas = [UnitScalar._is_delta_unit(x) for x in distinct]
+        if any(deltas) and not all(deltas):
+            raise Exception(
+                "Cannot mix temperature differences and absolute temperatures"
+            )
+        mults = np.array([entry[2] for entry in parsed])
+        offsets = np.array([UnitScalar._unit_offset(x) for x in distinct])
+        if inverse is None:
+            values = (values + offsets[0]) * mults[0]
+        else:
+            values = (values + offsets[inverse]) * mults[inverse]
+
+        new = cls(values, "")
+        new.num_unit = list(parsed[0][0])
+        new.den_unit = list(parsed[0][1])
+        new.temp_delta = deltas[0]
+        return new
 
     # Export units as a string
     def units(self) -> str:
         unit_str = ""
         for unit, i in zip(self.num_unit, range(len(self.num_unit))):
-            unit_str += f"{unit.unit}{unit.exp if unit.exp > 1 else ''}"
+            unit_str += UnitScalar._format_unit(unit)
             if i + 1 != len(self.num_unit):
                 unit_str += " "
         if len(self.den_unit) > 0:
@@ -241,7 +549,7 @@ class UnitScalar(lie(float)):
             else:
                 unit_str += "1/"
         for unit, i in zip(self.den_unit, range(len(self.den_unit))):
-            unit_str += f"{unit.unit}{unit.exp if unit.exp > 1 else ''}"
+            unit_str += UnitScalar._format_unit(unit)
             if i + 1 != len(self.den_unit):
                 unit_str += " "
 
@@ -255,20 +563,31 @@ class UnitScalar(lie(float)):
             else f"{(self.num):.2E} {unit_str}"
         )
 
-    # Returns in base (mKgs) units
+    # Returns in base (mKgs) units, as a built-in float for scalar values
     def __float__(self) -> float | np.ndarray:
-        return self.num
+        return self.num if isinstance(self.num, np.ndarray) else float(self.num)
 
     # Returns in base (mKgs) units
     def __int__(self) -> int:
         return int(self.num)
 
-    def to_units(self, target: str) -> float:
+    def to_units(self, target: str) -> float | np.ndarray:
         if not self.units_agree(target):
             raise Exception("Target units not equivalent with self!")
+        offset = UnitScalar._unit_offset(target)
+        if self.temp_delta and offset != 0.0:
+            raise Exception(
+                f'Temperature difference cannot be expressed in "{target}", '
+                f'use "delta_{target.strip()}"'
+            )
+        if not self.temp_delta and UnitScalar._is_delta_unit(target):
+            raise Exception(
+                f'Absolute temperature cannot be expressed in "{target}", '
+                "subtract a reference temperature first"
+            )
 
         # https://stackoverflow.com/a/431868/3339274
-        return self.num / UnitScalar._parse_units(target)[2]
+        return self.num / UnitScalar._parse_units_cached(target)[2] - offset
 
     # Implement format strings. Normal Python format string for floats, then an
     # optional unit conversion term, separated by a semicolon
@@ -285,22 +604,14 @@ class UnitScalar(lie(float)):
     # https://stackoverflow.com/a/48709142/3339274
     def units_agree(self, other: UnitScalar | str) -> bool:
         if isinstance(other, UnitScalar):
-            # Substitute and reduce
-            self_num_unit, self_den_unit = UnitScalar._reduce_units(
+            return UnitScalar._dimension(
                 self.num_unit, self.den_unit
-            )
-            oth_num_unit, oth_den_unit = UnitScalar._reduce_units(
-                other.num_unit, other.den_unit
-            )
-
-            # Sort by unit string
-            self_num_sort = sorted(self_num_unit, key=lambda x: x.unit)
-            self_den_sort = sorted(self_den_unit, key=lambda x: x.unit)
-            oth_num_sort = sorted(oth_num_unit, key=lambda x: x.unit)
-            oth_den_sort = sorted(oth_den_unit, key=lambda x: x.unit)
-            return self_num_sort == oth_num_sort and self_den_sort == oth_den_sort
+            ) == UnitScalar._dimension(other.num_unit, other.den_unit)
         elif isinstance(other, str):
-            return self.units_agree(UnitScalar(0.0, other))
+            return (
+                UnitScalar._dimension(self.num_unit, self.den_unit)
+                == UnitScalar._parse_units_cached(other)[3]
+            )
         else:
             return NotImplemented
 
@@ -321,8 +632,9 @@ class UnitScalar(lie(float)):
             if self.units_agree(other):
                 new = UnitScalar(self.num + other.num, "")
                 # https://stackoverflow.com/a/17873397/3339274
-                new.num_unit = copy.deepcopy(self.num_unit)
-                new.den_unit = copy.deepcopy(self.den_unit)
+                new.num_unit = list(self.num_unit)
+                new.den_unit = list(self.den_unit)
+                new.temp_delta = UnitScalar._sum_is_delta(self, other)
                 return new
             else:
                 raise Exception("LHS and RHS units don't agree")
@@ -333,8 +645,9 @@ class UnitScalar(lie(float)):
             elif self.num == 0 or other == 0:
                 new = UnitScalar(self.num + other, "")
                 # https://stackoverflow.com/a/17873397/3339274
-                new.num_unit = copy.deepcopy(self.num_unit)
-                new.den_unit = copy.deepcopy(self.den_unit)
+                new.num_unit = list(self.num_unit)
+                new.den_unit = list(self.den_unit)
+                new.temp_delta = self.temp_delta
                 return new
             else:
                 raise Exception("Cannot add unitless and unitful operands")
@@ -345,8 +658,9 @@ class UnitScalar(lie(float)):
         if isinstance(other, UnitScalar):
             if self.units_agree(other):
                 new = UnitScalar(self.num - other.num, "")
-                new.num_unit = copy.deepcopy(self.num_unit)
-                new.den_unit = copy.deepcopy(self.den_unit)
+                new.num_unit = list(self.num_unit)
+                new.den_unit = list(self.den_unit)
+                new.temp_delta = UnitScalar._difference_is_delta(self, other)
                 return new
             else:
                 raise Exception("LHS and RHS units don't agree")
@@ -356,8 +670,9 @@ class UnitScalar(lie(float)):
             elif self.num == 0 or other == 0:
                 new = UnitScalar(self.num - other, "")
                 # https://stackoverflow.com/a/17873397/3339274
-                new.num_unit = copy.deepcopy(self.num_unit)
-                new.den_unit = copy.deepcopy(self.den_unit)
+                new.num_unit = list(self.num_unit)
+                new.den_unit = list(self.den_unit)
+                new.temp_delta = self.temp_delta
                 return new
             else:
                 raise Exception("Cannot subtract unitless and unitful operands")
@@ -368,8 +683,9 @@ class UnitScalar(lie(float)):
         if isinstance(other, UnitScalar):
             if self.units_agree(other):
                 new = UnitScalar(other.num - self.num, "")
-                new.num_unit = copy.deepcopy(self.num_unit)
-                new.den_unit = copy.deepcopy(self.den_unit)
+                new.num_unit = list(self.num_unit)
+                new.den_unit = list(self.den_unit)
+                new.temp_delta = UnitScalar._difference_is_delta(other, self)
                 return new
             else:
                 raise Exception("LHS and RHS units don't agree")
@@ -379,8 +695,9 @@ class UnitScalar(lie(float)):
             elif self.num == 0 or other == 0:
                 new = UnitScalar(other - self.num, "")
                 # https://stackoverflow.com/a/17873397/3339274
-                new.num_unit = copy.deepcopy(self.num_unit)
-                new.den_unit = copy.deepcopy(self.den_unit)
+                new.num_unit = list(self.num_unit)
+                new.den_unit = list(self.den_unit)
+                new.temp_delta = self.temp_delta
                 return new
             else:
                 raise Exception("Cannot subtract unitless and unitful operands")
@@ -395,11 +712,15 @@ class UnitScalar(lie(float)):
             new.num_unit, new.den_unit = UnitScalar._reduce_units(
                 new.num_unit, new.den_unit
             )
+            new.temp_delta = UnitScalar._scaled_delta(
+                self, other
+            ) or UnitScalar._scaled_delta(other, self)
             return new
         elif isinstance(other, nums.Real) or isinstance(other, np.ndarray):
             new = UnitScalar(self.num * other, "")
-            new.num_unit = copy.deepcopy(self.num_unit)
-            new.den_unit = copy.deepcopy(self.den_unit)
+            new.num_unit = list(self.num_unit)
+            new.den_unit = list(self.den_unit)
+            new.temp_delta = self.temp_delta
             return new
         else:
             return NotImplemented
@@ -412,11 +733,13 @@ class UnitScalar(lie(float)):
             new.num_unit, new.den_unit = UnitScalar._reduce_units(
                 new.num_unit, new.den_unit
             )
+            new.temp_delta = UnitScalar._scaled_delta(self, other)
             return new
         elif isinstance(other, nums.Real) or isinstance(other, np.ndarray):
             new = UnitScalar(self.num / other, "")
-            new.num_unit = copy.deepcopy(self.num_unit)
-            new.den_unit = copy.deepcopy(self.den_unit)
+            new.num_unit = list(self.num_unit)
+            new.den_unit = list(self.den_unit)
+            new.temp_delta = self.temp_delta
             return new
         else:
             return NotImplemented
@@ -429,23 +752,48 @@ class UnitScalar(lie(float)):
             new.num_unit, new.den_unit = UnitScalar._reduce_units(
                 new.num_unit, new.den_unit
             )
+            new.temp_delta = UnitScalar._scaled_delta(other, self)
             return new
         elif isinstance(other, nums.Real) or isinstance(other, np.ndarray):
             new = UnitScalar(other / self.num, "")
-            new.num_unit = copy.deepcopy(self.den_unit)
-            new.den_unit = copy.deepcopy(self.num_unit)
+            new.num_unit = list(self.den_unit)
+            new.den_unit = list(self.num_unit)
             return new
         else:
             return NotImplemented
 
-    def __pow__(self, power: nums.Integral) -> UnitScalar:
-        new = UnitScalar(self.num**power, "")
-        new.num_unit = copy.deepcopy(self.num_unit)
-        new.den_unit = copy.deepcopy(self.den_unit)
-        for i in range(len(new.num_unit)):
-            new.num_unit[i].exp *= power
-        for i in range(len(new.den_unit)):
-            new.den_unit[i].exp *= power
+    # Raise to an integer or rational power. Unit exponents are kept exact, so
+    # e.g. (x**0.5)**2 has exactly the units of x. Unitless values take any
+    # real power
+    def __pow__(self, power: nums.Real) -> UnitScalar:
+        if self.num_unit == [] and self.den_unit == []:
+            return UnitScalar(self.num**power, "")
+        exp = UnitScalar._to_exponent(power)
+        return self._pow_exact(
+            self.num ** (exp if type(exp) is int else float(exp)), exp
+        )
+
+    def sqrt(self) -> UnitScalar:
+        return self._pow_exact(np.sqrt(self.num), Fraction(1, 2))
+
+    # Unlike a 1/3 power, handles negative values of the number
+    def cbrt(self) -> UnitScalar:
+        return self._pow_exact(np.cbrt(self.num), Fraction(1, 3))
+
+    # Build a new UnitScalar from an already-exponentiated number and the exact
+    # exponent to apply to the units. Negative exponents flip the unit fraction
+    def _pow_exact(self, num: float | np.ndarray, exp: int | Fraction) -> UnitScalar:
+        new = UnitScalar(num, "")
+        new.temp_delta = self.temp_delta and exp == 1
+        num_unit, den_unit = self.num_unit, self.den_unit
+        if exp < 0:
+            num_unit, den_unit, exp = den_unit, num_unit, -exp
+        new.num_unit = [
+            UnitScalar.SimpleUnit(x.unit, x.exp * exp) for x in num_unit if exp != 0
+        ]
+        new.den_unit = [
+            UnitScalar.SimpleUnit(x.unit, x.exp * exp) for x in den_unit if exp != 0
+        ]
         return new
 
     # Scalar addition/multiplication is commutative
@@ -0,0 +1,628 @@
+from __future__ import annotations
+from .UnitScalar import UnitScalar
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    take,
+)
+from pandas.api.indexers import check_array_indexer
+from typing import Any, Callable, Sequence
+import numbers as nums
+import numpy as np
+import operator
+import pandas as pd
+import re
+
+# pandas ExtensionDtype/ExtensionArray for unit-aware columns. Importing this
+# module requires pandas, which is otherwise not a dependency of unitscalar:
+#
+#   >>> from unitscalar import UnitScalarArray as usa
+#   >>> s = pd.Series(["10 psi", "3.2 kPa"], dtype="unit[kPa]")
+#   >>> s.astype("unit[psi]").max()
+
+
+# Column data type, parametrized by the unit string every value is stored in,
+# e.g. "unit[kPa]"
+@register_extension_dtype
+class UnitDtype(ExtensionDtype):
+    type = UnitScalar
+    kind = "O"
+    na_value = np.nan
+    _is_numeric = True
+    _metadata = ("units",)
+    _match = re.compile(r"^unit\[(?P<units>.*)\]$")
+
+    def __init__(self, units: str = "") -> None:
+        # Fail early on invalid unit strings
+        UnitScalar._parse_units_cached(units)
+        self.units = units
+
+    @property
+    def name(self) -> str:
+        return f"unit[{self.units}]"
+
+    @classmethod
+    def construct_from_string(cls, string: str) -> UnitDtype:
+        if not isinstance(string, str):
+            raise TypeError(
+                f"'construct_from_string' expects a string, got {type(string)}"
+            )
+        match = cls._match.match(string)
+        if match is None:
+            raise TypeError(f"Cannot construct a '{cls.__name__}' from '{string}'")
+        return cls(match.group("units"))
+
+    @classmethod
+    def construct_array_type(cls) -> type[UnitScalarArray]:
+        return UnitScalarArray
+
+    # Columns in equivalent units (e.g. kPa and psi) combine into the first
+    # column's units when concatenated
+    def _get_common_dtype(self, dtypes: list[Any]) -> UnitDtype | None:
+        if all(
+            isinstance(x, UnitDtype)
+            and UnitScalar._parse_units_cached(x.units)[3]
+            == UnitScalar._parse_units_cached(self.units)[3]
+            for x in dtypes
+        ):
+            return self
+        return None
+
+
+# Unit-aware column: a float64 buffer of values in dtype.units. Arithmetic,
+# conversion and reductions act on the whole buffer at once, using the
+# UnitScalar unit machinery only once per operation
+class UnitScalarArray(ExtensionArray):
+    # Make numpy defer binary operations with ndarrays to this class
+    __array_priority__ = 1000
+
+    # Reductions/group-by aggregations (and their numpy implementations) that
+    # keep the column's units. std/sem/var of absolute temperatures become
+    # temperature differences, and var squares the units
+    _REDUCTIONS = {
+        "sum": (np.sum, np.nansum),
+        "mean": (np.mean, np.nanmean),
+        "median": (np.median, np.nanmedian),
+        "min": (np.min, np.nanmin),
+        "max": (np.max, np.nanmax),
+        "std": (np.std, np.nanstd),
+        "var": (np.var, np.nanvar),
+    }
+    _GROUPBY_SAME_UNITS = {
+        "sum",
+        "cumsum",
+        "mean",
+        "median",
+        "min",
+        "max",
+        "cummin",
+        "cummax",
+        "first",
+        "last",
+        "std",
+        "sem",
+        "var",
+    }
+    _GROUPBY_UNITLESS = {"rank", "idxmin", "idxmax"}
+    # Accumulations (as numpy ufuncs, with the value that skips NaNs) that keep
+    # the column's units
+    _ACCUMULATIONS = {
+        "cumsum": (np.add, 0.0),
+        "cummin": (np.minimum, np.inf),
+        "cummax": (np.maximum, -np.inf),
+    }
+    # numpy ufuncs handled like the matching operators (comparisons with the
+    # operator to use when the column is the right operand), and ones whose
+    # results carry no units
+    _UFUNC_OPERATORS = {
+        np.add: operator.add,
+        np.subtract: operator.sub,
+        np.multiply: operator.mul,
+        np.true_divide: operator.truediv,
+        np.power: operator.pow,
+    }
+    _UFUNC_COMPARISONS = {
+        np.equal: (operator.eq, operator.eq),
+        np.not_equal: (operator.ne, operator.ne),
+        np.less: (operator.lt, operator.gt),
+        np.less_equal: (operator.le, operator.ge),
+        np.greater: (operator.gt, operator.lt),
+        np.greater_equal: (operator.ge, operator.le),
+    }
+    _UFUNC_UNITLESS = {np.isnan, np.isinf, np.isfinite}
+
+    def __init__(
+        self, values: np.ndarray, dtype: UnitDtype | str | None = None
+    ) -> None:
+        if dtype is None:
+            dtype = UnitDtype()
+        elif isinstance(dtype, str):
+            dtype = UnitDtype.construct_from_string(dtype)
+        self._data = np.asarray(values, dtype=np.float64).reshape(-1)
+        self._dtype = dtype
+
+    # Wrap an (array-valued) UnitScalar. Unless given, the units are the reduced
+    # SI units of the value, the same ones UnitScalar.units() reports. The
+    # buffer is always a fresh, writable copy (scalars are broadcast read-only)
+    @classmethod
+    def from_unitscalar(
+        cls, value: UnitScalar, units: str | None = None
+    ) -> UnitScalarArray:
+        if units is None:
+            units = value.units()
+        elif units in UnitScalar.OFFSET_UNITS and value.temp_delta:
+            units = f"delta_{units}"
+        elif UnitScalar._is_delta_unit(units) and not value.temp_delta:
+            units = units.strip()[len("delta_") :]
+        return cls(
+            np.array(
+                np.broadcast_to(value.to_units(units), np.shape(value.num)),
+                dtype=np.float64,
+            ),
+            UnitDtype(units),
+        )
+
+    # Array-valued UnitScalar of the whole column
+    def to_unitscalar(self) -> UnitScalar:
+        return UnitScalar(self._data, self.dtype.units)
+
+    def to_units(self, units: str) -> UnitScalarArray:
+        return UnitScalarArray(
+            UnitScalar.convert(self._data, self.dtype.units, units), UnitDtype(units)
+        )
+
+    # Construction ############################################################
+
+    @classmethod
+    def _from_sequence(
+        cls,
+        scalars: Sequence[Any],
+        *,
+        dtype: UnitDtype | str | None = None,
+        copy: bool = False,
+    ) -> UnitScalarArray:
+        if isinstance(dtype, str):
+            dtype = UnitDtype.construct_from_string(dtype)
+        if isinstance(scalars, UnitScalarArray):
+            return scalars.astype(dtype) if dtype is not None else scalars.copy()
+
+        scalars = (
+            np.asarray(scalars, dtype=object)
+            if not isinstance(scalars, np.ndarray)
+            else scalars
+        )
+        # Lists of quantity literals (maybe with missing values) parse in bulk
+        if scalars.dtype.kind == "U" or (
+            scalars.dtype.kind == "O"
+            and all(isinstance(x, str) for x in scalars[~pd.isna(scalars)])
+        ):
+            return cls._from_sequence_of_strings(scalars, dtype=dtype)
+
+        if dtype is None:
+            dtype = next(
+                (
+                    UnitDtype(x.units())
+                    for x in scalars.flat
+                    if isinstance(x, UnitScalar)
+                ),
+                UnitDtype(),
+            )
+        # Plain numbers are taken to be in the dtype's units already
+        if scalars.dtype.kind in "iuf":
+            return cls(scalars.astype(np.float64, copy=copy), dtype)
+
+        values = np.empty(len(scalars), dtype=np.float64)
+        for i, x in enumerate(scalars):
+            if isinstance(x, UnitScalar):
+                values[i] = x.to_units(dtype.units)
+            elif isinstance(x, str):
+                values[i] = UnitScalar.parse(x).to_units(dtype.units)
+            elif pd.isna(x):
+                values[i] = np.nan
+            else:
+                values[i] = float(x)
+        return cls(values, dtype)
+
+    # Quantity literals, e.g. "3.2 kPa", parsed in bulk by UnitScalar.parse_array.
+    # Missing cells (e.g. empty CSV fields, which pandas passes as NaN) stay NaN
+    @classmethod
+    def _from_sequence_of_strings(
+        cls,
+        strings: Sequence[str],
+        *,
+        dtype: UnitDtype | str | None = None,
+        copy: bool = False,
+    ) -> UnitScalarArray:
+        if isinstance(dtype, str):
+            dtype = UnitDtype.construct_from_string(dtype)
+        strings = np.asarray(strings)
+        missing = pd.isna(strings) if strings.dtype.kind == "O" else None
+        if missing is not None and missing.all():
+            return cls(np.full(len(strings), np.nan), dtype)
+        elif missing is not None and missing.any():
+            present = cls._from_sequence_of_strings(strings[~missing], dtype=dtype)
+            values = np.full(len(strings), np.nan)
+            values[~missing] = present._data
+            return cls(values, present.dtype)
+
+        parsed = UnitScalar.parse_array(strings)
+        if dtype is None:
+            return cls.from_unitscalar(parsed)
+        return cls(parsed.to_units(dtype.units), dtype)
+
+    @classmethod
+    def _from_factorized(
+        cls, values: np.ndarray, original: UnitScalarArray
+    ) -> UnitScalarArray:
+        return cls(values, original.dtype)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence[UnitScalarArray]) -> UnitScalarArray:
+        dtype = to_concat[0].dtype
+        return cls(np.concatenate([x.astype(dtype)._data for x in to_concat]), dtype)
+
+    # Array protocol ##########################################################
+
+    @property
+    def dtype(self) -> UnitDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, item: Any) -> UnitScalar | UnitScalarArray | float:
+        if isinstance(item, nums.Integral):
+            value = self._data[item]
+            return (
+                self.dtype.na_value
+                if np.isnan(value)
+                else UnitScalar(value, self.dtype.units)
+            )
+        item = check_array_indexer(self, item)
+        return UnitScalarArray(self._data[item], self.dtype)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        key = check_array_indexer(self, key)
+        if isinstance(value, str):
+            value = UnitScalar.parse(value)
+        if isinstance(value, UnitScalar):
+            value = value.to_units(self.dtype.units)
+        elif pd.api.types.is_list_like(value):
+            value = UnitScalarArray._from_sequence(value, dtype=self.dtype)._data
+        elif pd.isna(value):
+            value = np.nan
+        self._data[key] = value
+
+    # Plain floats in the column's units
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        return np.array(self._data, dtype=dtype, copy=copy)
+
+    def isna(self) -> np.ndarray:
+        return np.isnan(self._data)
+
+    # Membership follows UnitScalar equality: values in equivalent units match
+    # within floating-point tolerance, plain numbers only match unitless columns
+    # and values in other dimensions never match
+    def isin(self, values: Any) -> np.ndarray:
+        lhs = self.to_unitscalar()
+        targets = []
+        has_na = False
+        for x in values:
+            if isinstance(x, str):
+                x = UnitScalar.parse(x)
+            elif isinstance(x, nums.Real) and not pd.isna(x):
+                x = UnitScalar(float(x), "")
+            if isinstance(x, UnitScalar):
+                if lhs.units_agree(x):
+                    targets.append(x.to_units(self.dtype.units))
+            elif pd.isna(x):
+                has_na = True
+
+        found = np.isnan(self._data) if has_na else np.zeros(len(self), dtype=bool)
+        if targets:
+            # Only the nearest target on either side can be close to each value
+            targets = np.sort(np.asarray(targets, dtype=np.float64))
+            right = np.minimum(np.searchsorted(targets, self._data), targets.size - 1)
+            left = np.maximum(right - 1, 0)
+            found |= np.isclose(self._data, targets[left])
+            found |= np.isclose(self._data, targets[right])
+        return found
+
+    def copy(self) -> UnitScalarArray:
+        return UnitScalarArray(self._data.copy(), self.dtype)
+
+    def take(
+        self,
+        indices: Sequence[int],
+        *,
+        allow_fill: bool = False,
+        fill_value: Any = None,
+    ) -> UnitScalarArray:
+        if allow_fill and fill_value is not None and not pd.isna(fill_value):
+            fill_value = UnitScalarArray._from_sequence(
+                [fill_value], dtype=self.dtype
+            )._data[0]
+        else:
+            fill_value = np.nan
+        return UnitScalarArray(
+            take(self._data, indices, allow_fill=allow_fill, fill_value=fill_value),
+            self.dtype,
+        )
+
+    def astype(self, dtype: Any, copy: bool = True) -> Any:
+        if isinstance(dtype, str) and UnitDtype._match.match(dtype):
+            dtype = UnitDtype.construct_from_string(dtype)
+        if isinstance(dtype, UnitDtype):
+            if dtype == self.dtype:
+                return self.copy() if copy else self
+            return self.to_units(dtype.units)
+        return super().astype(dtype, copy=copy)
+
+    def _values_for_factorize(self) -> tuple[np.ndarray, float]:
+        return self._data, np.nan
+
+    def _values_for_argsort(self) -> np.ndarray:
+        return self._data
+
+    def _formatter(self, boxed: bool = False) -> Callable[[Any], str]:
+        def fmt(x: Any) -> str:
+            if not isinstance(x, UnitScalar):
+                return str(x)
+            return f"{x.to_units(self.dtype.units):g} {self.dtype.units}".strip()
+
+        return fmt
+
+    # Operators ###############################################################
+
+    # The other operand as a UnitScalar, with plain numbers/arrays unitless
+    @staticmethod
+    def _as_unitscalar(other: Any) -> UnitScalar:
+        if isinstance(other, UnitScalarArray):
+            return other.to_unitscalar()
+        elif isinstance(other, UnitScalar):
+            return other
+        elif isinstance(other, nums.Real):
+            return UnitScalar(float(other), "")
+        else:
+            return UnitScalar(np.asarray(other, dtype=np.float64), "")
+
+    def _arith(
+        self, other: Any, op: Callable, reverse: bool = False
+    ) -> UnitScalarArray:
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        lhs = self.to_unitscalar()
+        if op is operator.pow:
+            if reverse or not isinstance(other, nums.Real):
+                raise TypeError(
+                    "Unit-aware columns can only be raised to scalar powers"
+                )
+            return UnitScalarArray.from_unitscalar(lhs**other)
+
+        rhs = UnitScalarArray._as_unitscalar(other)
+        result = op(rhs, lhs) if reverse else op(lhs, rhs)
+        # Results with the column's dimension (sums, differences, scaling by
+        # plain numbers) stay in the column's units
+        units = self.dtype.units if result.units_agree(lhs) else None
+        return UnitScalarArray.from_unitscalar(result, units)
+
+    def _compare(self, other: Any, op: Callable) -> np.ndarray:
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        lhs = self.to_unitscalar()
+        try:
+            rhs = UnitScalarArray._as_unitscalar(other)
+        except (TypeError, ValueError):
+            rhs = None
+        if rhs is None or not lhs.units_agree(rhs):
+            if op is operator.eq:
+                return np.zeros(len(self), dtype=bool)
+            elif op is operator.ne:
+                return np.ones(len(self), dtype=bool)
+            raise TypeError("Cannot compare operands with different units")
+        return op(lhs.num, rhs.num)
+
+    def __add__(self, other: Any) -> UnitScalarArray:
+        return self._arith(other, operator.add)
+
+    def __radd__(self, other: Any) -> UnitScalarArray:
+        return self._arith(other, operator.add, reverse=True)
+
+    def __sub__(self, other: Any) -> UnitScalarArray:
+        return self._arith(other, operator.sub)
+
+    def __rsub__(self, other: Any) -> UnitScalarArray:
+        return self._arith(other, operator.sub, reverse=True)
+
+    def __mul__(self, other: Any) -> UnitScalarArray:
+        return self._arith(other, operator.mul)
+
+    def __rmul__(self, other: Any) -> UnitScalarArray:
+        return self._arith(other, operator.mul, reverse=True)
+
+    def __truediv__(self, other: Any) -> UnitScalarArray:
+        return self._arith(other, operator.truediv)
+
+    def __rtruediv__(self, other: Any) -> UnitScalarArray:
+        return self._arith(other, operator.truediv, reverse=True)
+
+    def __pow__(self, other: Any) -> UnitScalarArray:
+        return self._arith(other, operator.pow)
+
+    def __rpow__(self, other: Any) -> UnitScalarArray:
+        return self._arith(other, operator.pow, reverse=True)
+
+    def __eq__(self, other: Any) -> np.ndarray:  # type: ignore[override]
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other: Any) -> np.ndarray:  # type: ignore[override]
+        return self._compare(other, operator.ne)
+
+    def __lt__(self, other: Any) -> np.ndarray:
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other: Any) -> np.ndarray:
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other: Any) -> np.ndarray:
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other: Any) -> np.ndarray:
+        return self._compare(other, operator.ge)
+
+    # Unary operators act on the numbers in the column's units. The sign of an
+    # absolute degC/degF temperature depends on its zero point, so those refuse
+    def _unary(self, func: Callable) -> UnitScalarArray:
+        if self.dtype.units in UnitScalar.OFFSET_UNITS:
+            raise TypeError(
+                f"Cannot apply {func.__name__} to absolute temperatures in "
+                f'"{self.dtype.units}"'
+            )
+        return UnitScalarArray(func(self._data), self.dtype)
+
+    def __neg__(self) -> UnitScalarArray:
+        return self._unary(np.negative)
+
+    def __pos__(self) -> UnitScalarArray:
+        return self.copy()
+
+    def __abs__(self) -> UnitScalarArray:
+        return self._unary(np.absolute)
+
+    # numpy functions follow UnitScalar rules, e.g. np.sqrt(s) is in m(1/2) for a
+    # "unit[m]" column. Unsupported ones return NotImplemented, so numpy raises
+    # instead of silently dropping the units
+    def __array_ufunc__(
+        self, ufunc: np.ufunc, method: str, *inputs: Any, **kwargs: Any
+    ) -> Any:
+        if (
+            method != "__call__"
+            or kwargs
+            or any(isinstance(x, (pd.Series, pd.Index, pd.DataFrame)) for x in inputs)
+        ):
+            return NotImplemented
+
+        reverse = inputs[0] is not self
+        other = inputs[0] if reverse else inputs[-1]
+        if ufunc in UnitScalarArray._UFUNC_OPERATORS:
+            return self._arith(other, UnitScalarArray._UFUNC_OPERATORS[ufunc], reverse)
+        elif ufunc in UnitScalarArray._UFUNC_COMPARISONS:
+            op = UnitScalarArray._UFUNC_COMPARISONS[ufunc][1 if reverse else 0]
+            return self._compare(other, op)
+        elif ufunc in UnitScalarArray._UFUNC_UNITLESS:
+            return ufunc(self._data)
+        elif ufunc is np.negative:
+            return -self
+        elif ufunc is np.positive:
+            return +self
+        elif ufunc in (np.absolute, np.fabs):
+            return abs(self)
+        elif ufunc is np.sqrt:
+            return UnitScalarArray.from_unitscalar(self.to_unitscalar().sqrt())
+        elif ufunc is np.cbrt:
+            return UnitScalarArray.from_unitscalar(self.to_unitscalar().cbrt())
+        elif ufunc is np.square:
+            return self._arith(2, operator.pow)
+        elif ufunc is np.reciprocal:
+            return self._arith(1, operator.truediv, reverse=True)
+        return NotImplemented
+
+    # Reductions ##############################################################
+
+    # Wrap reduced/aggregated values (in the column's units) with the units the
+    # operation produces, see _REDUCTIONS
+    def _with_result_units(self, values: np.ndarray, how: str) -> UnitScalarArray:
+        units = self.dtype.units
+        if (
+            how in ("sum", "cumsum")
+            and not UnitScalar._is_delta_unit(units)
+            and UnitScalar._parse_units_cached(units)[3] == UnitScalar._TEMPERATURE
+        ):
+            raise TypeError(f'Cannot {how} absolute temperatures in "{units}"')
+        elif units in UnitScalar.OFFSET_UNITS and how in ("std", "sem", "var"):
+            units = f"delta_{units}"
+        if how == "var":
+            square = UnitScalar(1.0, units) ** 2
+            return UnitScalarArray(values * square.num, UnitDtype(square.units()))
+        return UnitScalarArray(values, UnitDtype(units))
+
+    def _reduce(
+        self, name: str, *, skipna: bool = True, keepdims: bool = False, **kwargs
+    ) -> Any:
+        if name not in UnitScalarArray._REDUCTIONS:
+            raise TypeError(f"'{name}' is not supported for '{self.dtype}' columns")
+        func = UnitScalarArray._REDUCTIONS[name][1 if skipna else 0]
+        args = {"ddof": kwargs.get("ddof", 1)} if name in ("std", "var") else {}
+        if name in ("min", "max", "median") and not self._data.size:
+            value = np.nan
+        elif name == "sum" and np.count_nonzero(~np.isnan(self._data)) < kwargs.get(
+            "min_count", 0
+        ):
+            value = np.nan
+        else:
+            value = func(self._data, **args)
+
+        result = self._with_result_units(np.array([value]), name)
+        return result if keepdims else result[0]
+
+    # Quantiles keep the column's units. Like every other reduction they come out
+    # as UnitScalars, so describe(), which casts its rows with float(), reports
+    # all of them consistently in SI base units
+    def _quantile(self, qs: np.ndarray, interpolation: str) -> UnitScalarArray:
+        if not self._data.size or np.isnan(self._data).all():
+            return UnitScalarArray(np.full(len(qs), np.nan), self.dtype)
+        return UnitScalarArray(
+            np.nanquantile(self._data, qs, method=interpolation), self.dtype
+        )
+
+    # Cumulative sum/min/max, see _ACCUMULATIONS. When skipping NaNs, missing
+    # values stay missing without resetting the running result
+    def _accumulate(
+        self, name: str, *, skipna: bool = True, **kwargs
+    ) -> UnitScalarArray:
+        if name not in UnitScalarArray._ACCUMULATIONS:
+            raise TypeError(f"'{name}' is not supported for '{self.dtype}' columns")
+        ufunc, skip_value = UnitScalarArray._ACCUMULATIONS[name]
+        if not skipna:
+            return self._with_result_units(ufunc.accumulate(self._data), name)
+        missing = np.isnan(self._data)
+        values = ufunc.accumulate(np.where(missing, skip_value, self._data))
+        values[missing] = np.nan
+        return self._with_result_units(values, name)
+
+    # Group-by aggregations group the float64 buffer as a plain Series, so they
+    # run pandas' compiled group-by kernels through its public API instead of
+    # falling back to a Python loop over groups. Group ids become categorical
+    # codes, so empty groups are kept and rows with ids of -1 (dropped NA groups)
+    # are left out
+    def _groupby_op(
+        self,
+        *,
+        how: str,
+        has_dropped_na: bool,
+        min_count: int,
+        ngroups: int,
+        ids: np.ndarray,
+        **kwargs,
+    ) -> Any:
+        if (
+            how
+            not in UnitScalarArray._GROUPBY_SAME_UNITS
+            | UnitScalarArray._GROUPBY_UNITLESS
+        ):
+            raise TypeError(f"'{how}' is not supported for '{self.dtype}' columns")
+        if how == "rank":
+            kwargs["method"] = kwargs.pop("ties_method")
+        elif how in ("sum", "min", "max", "first", "last"):
+            kwargs["min_count"] = min_count
+        groups = pd.Categorical.from_codes(ids, categories=range(ngroups))
+        grouped = pd.Series(self._data).groupby(groups, observed=False)
+        values = getattr(grouped, how)(**kwargs).to_numpy()
+        if how in UnitScalarArray._GROUPBY_UNITLESS:
+            return values
+        return self._with_result_units(values, how)
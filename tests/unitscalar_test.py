@@ -1,4 +1,6 @@
 from unitscalar import UnitScalar as us
+from concurrent.futures import ThreadPoolExecutor
+import dataclasses
 import numpy as np
 import unittest
 
@@ -96,6 +98,7 @@ class UnitScalarTest(unittest.TestCase):
         self.assertNotEqual(us.UnitScalar(3.14, "m"), us.UnitScalar(3, "m"))
         self.assertNotEqual(us.UnitScalar(3.14, "m"), us.UnitScalar(3.14, "s"))
         self.assertEqual(us.UnitScalar(3.14, "m s"), us.UnitScalar(3.14, "s m"))
+        self.assertIs(type(float(us.UnitScalar(np.float64(2.0), "km"))), float)
 
         # Basic arithmetic checkouts
         self.assertEqual(
@@ -124,6 +127,53 @@ class UnitScalarTest(unittest.TestCase):
         self.assertEqual(us.UnitScalar(2.0, "") / 3, us.UnitScalar(2 / 3, ""))
         self.assertEqual(1 / us.UnitScalar(2.0, ""), us.UnitScalar(1 / 2, ""))
 
+    def test_fractional_powers(self):
+        # Rational exponents are kept exact
+        self.assertEqual(us.UnitScalar(4.0, "m2/s2") ** 0.5, us.UnitScalar(2.0, "m/s"))
+        self.assertEqual(us.UnitScalar(2.0, "m").sqrt() ** 2, us.UnitScalar(2.0, "m"))
+        self.assertEqual(
+            us.UnitScalar(2.0, "m") ** (1 / 3) * us.UnitScalar(2.0, "m") ** (2 / 3),
+            us.UnitScalar(2.0, "m"),
+        )
+        self.assertEqual(us.UnitScalar(-8.0, "m3").cbrt(), us.UnitScalar(-2.0, "m"))
+        self.assertEqual(us.UnitScalar(2.0, "m/s") ** -1, us.UnitScalar(0.5, "s/m"))
+        self.assertEqual(
+            us.UnitScalar(np.array([4.0, 9.0]), "J/kg").sqrt(),
+            us.UnitScalar(np.array([2.0, 3.0]), "m/s"),
+        )
+
+        # Whole-number exponents are stored as ints
+        root = us.UnitScalar(4.0, "m2") ** 0.5
+        self.assertIs(type(root.num_unit[0].exp), int)
+        self.assertIs(type((root.sqrt() * root.sqrt()).num_unit[0].exp), int)
+
+        # Fractional exponents format and parse back
+        self.assertEqual(us.UnitScalar(2.0, "m").sqrt().units(), "m(1/2)")
+        self.assertEqual(
+            (us.UnitScalar(2.0, "m").sqrt() / us.UnitScalar(1.0, "s")).units(),
+            "m(1/2)/s",
+        )
+        self.assertTrue(us.UnitScalar(2.0, "m").sqrt().units_agree("m(1/2)"))
+        self.assertAlmostEqual(us.UnitScalar(9.0, "mm").sqrt().to_units("mm(1/2)"), 3)
+        self.assertTrue(us.UnitScalar(1.0, "m(-3/2)").units_agree("1/m(3/2)"))
+        # Only parenthesized exponents may be fractions
+        for unit_str in ("m2.5", "m(2.5)", "m(1/2"):
+            with self.assertRaises(Exception):
+                us.UnitScalar(1.0, unit_str)
+        with self.assertRaises(Exception):
+            us.UnitScalar(2.0, "m") ** 0.123456789
+        with self.assertRaises(Exception):
+            us.UnitScalar(2.0, "m") ** 0.333
+
+        # Unitless values take any real power
+        self.assertEqual(
+            us.UnitScalar(2.0, "") ** 0.123456789, us.UnitScalar(2.0**0.123456789, "")
+        )
+        self.assertEqual(
+            us.UnitScalar(np.array([2.0, 3.0]), "") ** 0.3,
+            us.UnitScalar(np.array([2.0, 3.0]) ** 0.3, ""),
+        )
+
     def test_vector_arithmetic(self):
         a = np.array([[1, 2], [3, 4]])
         b = np.array([[3, 4], [5, 6]])
@@ -176,6 +226,156 @@ class UnitScalarTest(unittest.TestCase):
             us.UnitScalar(3.14159, "kg").__format__("0.3f;lbm"), "6.926 lbm"
         )
 
+    def test_temperature(self):
+        # Offset units are absolute temperatures when used alone
+        self.assertEqual(us.UnitScalar(20.0, "degC"), us.UnitScalar(293.15, "K"))
+        self.assertEqual(us.UnitScalar(68.0, "degF"), us.UnitScalar(20.0, "degC"))
+        self.assertAlmostEqual(us.UnitScalar(300.0, "K").to_units("degC"), 26.85)
+        self.assertAlmostEqual(us.UnitScalar(100.0, "degC").to_units("degF"), 212.0)
+        self.assertEqual(
+            us.UnitScalar(20.0, "degC").__format__("0.1f;degF"), "68.0 degF"
+        )
+
+        # ...but only scale inside compound units
+        self.assertEqual(
+            us.UnitScalar(4186.0, "J/kg degC"), us.UnitScalar(4186.0, "J/kg K")
+        )
+        self.assertAlmostEqual(
+            us.UnitScalar(1.0, "J/degF").to_units("J/K"), 1.8, places=12
+        )
+
+        # Delta vs absolute semantics
+        diff = us.UnitScalar(30.0, "degC") - us.UnitScalar(20.0, "degC")
+        self.assertAlmostEqual(diff.to_units("delta_degC"), 10.0)
+        self.assertAlmostEqual(diff.to_units("delta_degF"), 18.0)
+        with self.assertRaises(Exception):
+            diff.to_units("degC")
+        warmer = us.UnitScalar(20.0, "degC") + us.UnitScalar(9.0, "delta_degF")
+        self.assertAlmostEqual(warmer.to_units("degC"), 25.0)
+        self.assertAlmostEqual((2 * diff).to_units("delta_degC"), 20.0)
+        self.assertAlmostEqual(
+            (diff * us.UnitScalar(2.0, "")).to_units("delta_degC"), 20.0
+        )
+        self.assertAlmostEqual(
+            (us.UnitScalar(2.0, "") * diff).to_units("delta_degC"), 20.0
+        )
+        self.assertAlmostEqual(
+            (diff / us.UnitScalar(2.0, "")).to_units("delta_degC"), 5.0
+        )
+        self.assertAlmostEqual((diff**1).to_units("delta_degC"), 10.0)
+        for scaled in (
+            diff * us.UnitScalar(2.0, ""),
+            diff / us.UnitScalar(2.0, ""),
+            diff**1,
+        ):
+            with self.assertRaises(Exception):
+                scaled.to_units("degC")
+        self.assertFalse((diff * diff).temp_delta)
+        with self.assertRaises(Exception):
+            us.UnitScalar(5.0, "delta_degC") - us.UnitScalar(20.0, "degC")
+        with self.assertRaises(Exception):
+            us.UnitScalar(20.0, "degC") + us.UnitScalar(20.0, "degC")
+        with self.assertRaises(Exception):
+            us.UnitScalar(20.0, "degC") + us.UnitScalar(20.0, "K")
+        with self.assertRaises(Exception):
+            us.UnitScalar(20.0, "degC").to_units("delta_degC")
+        self.assertTrue((diff + diff).temp_delta)
+
+        # Vectorized conversion
+        c = np.array([-40.0, 0.0, 100.0])
+        self.assertTrue(
+            np.allclose(us.UnitScalar(c, "degC").to_units("degF"), [-40, 32, 212])
+        )
+        self.assertTrue(
+            np.allclose(us.UnitScalar.convert(c, "degC", "degF"), [-40, 32, 212])
+        )
+        self.assertTrue(
+            np.allclose(us.UnitScalar.convert([-40, 32, 212], "degF", "K"), c + 273.15)
+        )
+        self.assertAlmostEqual(us.UnitScalar.convert(1.0, "km", "m"), 1000.0)
+        with self.assertRaises(Exception):
+            us.UnitScalar.convert(c, "degC", "m")
+        with self.assertRaises(Exception):
+            us.UnitScalar.convert(10.0, "delta_degC", "degC")
+        with self.assertRaises(Exception):
+            us.UnitScalar.convert(20.0, "degC", "delta_degC")
+        self.assertAlmostEqual(
+            us.UnitScalar.convert(10.0, "delta_degC", "delta_degF"), 18.0
+        )
+
+    def test_string_parsing(self):
+        # Single quantity literals
+        self.assertEqual(us.UnitScalar.parse("3.2 kPa"), us.UnitScalar(3.2, "kPa"))
+        self.assertEqual(us.UnitScalar.parse(" 10 psi "), us.UnitScalar(10, "psi"))
+        self.assertEqual(us.UnitScalar.parse("1.2e3 kg m/s2"), us.UnitScalar(1200, "N"))
+        self.assertEqual(us.UnitScalar.parse("20 degC"), us.UnitScalar(293.15, "K"))
+        self.assertEqual(us.UnitScalar.parse("5"), us.UnitScalar(5, ""))
+        self.assertEqual(us.UnitScalar.parse("3.2\tkPa"), us.UnitScalar(3.2, "kPa"))
+        self.assertEqual(
+            us.UnitScalar.parse("1.2e3  kg\tm/s2"), us.UnitScalar(1200, "N")
+        )
+        with self.assertRaises(ValueError):
+            us.UnitScalar.parse("kPa")
+        with self.assertRaises(ValueError):
+            us.UnitScalar.parse("3.2kPa")
+
+        # Bulk parsing, with mixed equivalent units and offset units
+        self.assertEqual(
+            us.UnitScalar.parse_array(["3.90 in", "1 m", "10 cm"]),
+            us.UnitScalar(np.array([0.09906, 1, 0.1]), "m"),
+        )
+        self.assertEqual(
+            us.UnitScalar.parse_array(
+                np.array([["0 degC", "32 degF"], ["1 K", "1 K"]])
+            ),
+            us.UnitScalar(np.array([[273.15, 273.15], [1, 1]]), "K"),
+        )
+        self.assertTrue(
+            us.UnitScalar.parse_array(["1 delta_degC", "1 delta_degF"]).temp_delta
+        )
+        self.assertEqual(us.UnitScalar.parse_array([]).num.shape, (0,))
+        self.assertEqual(
+            us.UnitScalar.parse_array(f"{x} mm" for x in range(3)),
+            us.UnitScalar(np.array([0.0, 1.0, 2.0]), "mm"),
+        )
+        with self.assertRaises(Exception):
+            us.UnitScalar.parse_array(["1 delta_degC", "1 degC"])
+        self.assertEqual(
+            us.UnitScalar.parse_array(["3.2\tkPa", "1 kPa", "2\t N/mm2"]),
+            us.UnitScalar(np.array([3.2, 1.0, 2000.0]), "kPa"),
+        )
+        with self.assertRaises(ValueError):
+            us.UnitScalar.parse_array(["3.2kPa", "1 kPa"])
+        with self.assertRaises(Exception):
+            us.UnitScalar.parse_array(["1 m", "1 s"])
+
+    def test_thread_safety(self):
+        # Shared unit metadata is immutable
+        with self.assertRaises(TypeError):
+            us.UnitScalar.VALID_UNITS["furlong"] = ("m", "", 201.168)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            us.UnitScalar.SimpleUnit("m", 1).exp = 2
+
+        # Operations never alias units between operands
+        a = us.UnitScalar(3.0, "m/s")
+        b = a**2 * a / a
+        self.assertEqual(a.units(), "m/s")
+        self.assertEqual(b.units(), "m2/s2")
+
+        # Hammer the parse cache from several threads at once
+        unit_strs = ["kg m/s2", "kPa", "mm(1/2)", "J/kg degC", "lbf", "uA s"]
+
+        def work(offset: int) -> bool:
+            for i in range(500):
+                unit_str = unit_strs[(i + offset) % len(unit_strs)]
+                x = us.UnitScalar(2.0, unit_str)
+                if not ((x * x).sqrt().units_agree(unit_str) and x == x + 0):
+                    return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            self.assertTrue(all(pool.map(work, range(16))))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,185 @@
+from unitscalar import UnitScalar as us
+import io
+import numpy as np
+import unittest
+
+try:
+    import pandas as pd
+    from unitscalar import UnitScalarArray as usa
+except ImportError:
+    pd = None
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class UnitScalarArrayTest(unittest.TestCase):
+    def setUp(self):
+        return super().setUp()
+
+    def tearDown(self):
+        return super().tearDown()
+
+    def test_construction(self):
+        # dtype strings, quantity literals and UnitScalar objects
+        s = pd.Series(["10 psi", "3.2 kPa"], dtype="unit[kPa]")
+        self.assertEqual(s.dtype, usa.UnitDtype("kPa"))
+        self.assertTrue(np.allclose(s.to_numpy(), [68.9475729, 3.2]))
+        s = pd.Series(["1 bar", None, "2\tpsi"], dtype="unit[kPa]")
+        self.assertTrue(np.allclose(s.dropna().to_numpy(), [100.0, 13.7895146]))
+        parsed = usa.UnitScalarArray._from_sequence(["1 km", "2 m"])
+        self.assertEqual(parsed[0], us.UnitScalar(1000.0, "m"))
+        s = pd.Series([us.UnitScalar(1.0, "m"), 25.0], dtype="unit[mm]")
+        self.assertTrue(np.allclose(s.to_numpy(), [1000.0, 25.0]))
+        self.assertEqual(s[0], us.UnitScalar(1.0, "m"))
+        self.assertTrue(pd.isna(pd.Series([1.0, None], dtype="unit[m]")[1]))
+        with self.assertRaises(Exception):
+            usa.UnitDtype("furlong")
+
+        # CSV columns of quantity literals, with a missing cell
+        csv = io.StringIO("p\n10 psi\n\n3.2 kPa\n")
+        df = pd.read_csv(csv, dtype={"p": "unit[kPa]"}, skip_blank_lines=False)
+        self.assertEqual(df["p"].dtype, usa.UnitDtype("kPa"))
+        self.assertTrue(np.isnan(df["p"].array._data[1]))
+        self.assertTrue(np.allclose(df["p"].dropna().to_numpy(), [68.9475729, 3.2]))
+
+        # Assigned quantity literals are converted to the column's units
+        s = pd.Series([1.0, 2.0, 3.0], dtype="unit[kPa]")
+        s[0] = "2 bar"
+        s[1:] = ["1 psi", us.UnitScalar(500.0, "Pa")]
+        self.assertTrue(np.allclose(s.to_numpy(), [200.0, 6.89475729, 0.5]))
+        with self.assertRaises(Exception):
+            s[0] = "1 m"
+
+        # Membership works across equivalent units only
+        self.assertEqual(
+            list(s.isin([us.UnitScalar(0.2, "MPa"), "500 Pa", 0.5])),
+            [True, False, True],
+        )
+        self.assertFalse(s.isin([us.UnitScalar(0.5, "m"), None]).any())
+        self.assertTrue(pd.Series([1.0, None], dtype="unit[m]").isin([None])[1])
+
+    def test_conversion(self):
+        s = pd.Series([0.0, 100.0], dtype="unit[degC]")
+        self.assertTrue(np.allclose(s.astype("unit[degF]").to_numpy(), [32, 212]))
+        self.assertTrue(np.allclose(s.array.to_units("K").to_numpy(), [273.15, 373.15]))
+        with self.assertRaises(Exception):
+            s.astype("unit[m]")
+
+        # Equivalent columns concatenate in the first column's units
+        both = pd.concat([s, pd.Series([32.0], dtype="unit[degF]")])
+        self.assertEqual(both.dtype, usa.UnitDtype("degC"))
+        self.assertTrue(np.allclose(both.to_numpy(), [0, 100, 0]))
+
+    def test_arithmetic(self):
+        a = pd.Series([1.0, 2.0], dtype="unit[m]")
+        b = pd.Series([100.0, 300.0], dtype="unit[cm]")
+        self.assertTrue(np.allclose((a + b).to_numpy(), [2.0, 5.0]))
+        self.assertEqual((a + b).dtype, usa.UnitDtype("m"))
+        self.assertEqual((a * b)[1], us.UnitScalar(6.0, "m2"))
+        self.assertEqual((a / b)[0], us.UnitScalar(1.0, ""))
+        self.assertEqual((2 * a)[1], us.UnitScalar(4.0, "m"))
+        self.assertEqual((1 / a)[1], us.UnitScalar(0.5, "1/m"))
+        self.assertEqual((a**2).sum(), us.UnitScalar(5.0, "m2"))
+        self.assertTrue((((a * a) ** 0.5) == a).all())
+        self.assertEqual(list(a > us.UnitScalar(150.0, "cm")), [False, True])
+        with self.assertRaises(Exception):
+            a + pd.Series([1.0, 2.0], dtype="unit[s]")
+        with self.assertRaises(Exception):
+            a + 1
+
+        # Unary operators and numpy functions keep units
+        self.assertEqual((-a)[1], us.UnitScalar(-2.0, "m"))
+        self.assertEqual(abs(-a).dtype, usa.UnitDtype("m"))
+        self.assertEqual((+a)[0], us.UnitScalar(1.0, "m"))
+        self.assertEqual(np.sqrt(a * a)[1], us.UnitScalar(2.0, "m"))
+        self.assertEqual(np.abs(-a)[1], us.UnitScalar(2.0, "m"))
+        self.assertEqual(np.multiply(2.0, a)[1], us.UnitScalar(4.0, "m"))
+        self.assertEqual(list(np.less(us.UnitScalar(1.5, "m"), a)), [False, True])
+        self.assertEqual(list(np.isnan(a)), [False, False])
+        with self.assertRaises(TypeError):
+            np.exp(a)
+
+        # Results are writable
+        r = a + a
+        r[0] = us.UnitScalar(5.0, "m")
+        r.loc[r > us.UnitScalar(3.5, "m")] = None
+        self.assertTrue(r.isna().all())
+
+        # Differences of absolute temperatures are temperature differences
+        t = pd.Series([20.0, 30.0], dtype="unit[degC]")
+        diff = t - pd.Series([10.0, 10.0], dtype="unit[degC]")
+        self.assertEqual(diff.dtype, usa.UnitDtype("delta_degC"))
+        self.assertTrue(np.allclose(diff.to_numpy(), [10.0, 20.0]))
+        self.assertTrue(np.allclose((t + diff).to_numpy(), [30.0, 50.0]))
+        self.assertTrue(np.allclose(diff.astype("unit[delta_degF]"), [18.0, 36.0]))
+        with self.assertRaises(Exception):
+            diff.astype("unit[degC]")
+        with self.assertRaises(Exception):
+            t.astype("unit[delta_degC]")
+        with self.assertRaises(Exception):
+            t + t
+        self.assertTrue(np.allclose((diff + diff).to_numpy(), [20.0, 40.0]))
+        self.assertEqual((2 * diff).dtype, usa.UnitDtype("delta_degC"))
+        self.assertTrue(np.allclose((diff / 2).to_numpy(), [5.0, 10.0]))
+
+    def test_reductions(self):
+        s = pd.Series([1.0, 2.0, 3.0, None], dtype="unit[kPa]")
+        self.assertEqual(s.sum(), us.UnitScalar(6.0, "kPa"))
+        self.assertEqual(s.mean(), us.UnitScalar(2.0, "kPa"))
+        self.assertEqual(s.max(), us.UnitScalar(3.0, "kPa"))
+        self.assertEqual(s.std(), us.UnitScalar(1.0, "kPa"))
+        self.assertEqual(s.var(), us.UnitScalar(1.0, "kPa") ** 2)
+
+        self.assertEqual(s.quantile(0.5), us.UnitScalar(2.0, "kPa"))
+        self.assertEqual(s.quantile([0.5]).dtype, usa.UnitDtype("kPa"))
+
+        # describe() reports every row in the same (SI) units
+        summary = s.describe()
+        self.assertEqual(summary["count"], 3)
+        for row, pascals in [("mean", 2000), ("std", 1000), ("min", 1000)]:
+            self.assertAlmostEqual(summary[row], pascals)
+        for row, pascals in [("25%", 1500), ("50%", 2000), ("max", 3000)]:
+            self.assertAlmostEqual(summary[row], pascals)
+        summary = s.astype(float).describe()
+        self.assertAlmostEqual(summary["mean"], 2.0)
+        self.assertAlmostEqual(summary["75%"], 2.5)
+
+        self.assertTrue(
+            np.allclose(s.cumsum().to_numpy(), [1, 3, 6, np.nan], equal_nan=True)
+        )
+        self.assertEqual(s.cummax().dtype, usa.UnitDtype("kPa"))
+        self.assertTrue(np.isnan(s[::-1].cumsum(skipna=False).array._data).all())
+        with self.assertRaises(TypeError):
+            s.cumprod()
+
+        t = pd.Series([20.0, 30.0], dtype="unit[degC]")
+        self.assertEqual(t.mean(), us.UnitScalar(25.0, "degC"))
+        self.assertAlmostEqual(t.std().to_units("delta_degF"), 9 * 2**0.5)
+        with self.assertRaises(TypeError):
+            t.sum()
+        with self.assertRaises(TypeError):
+            t.cumsum()
+        with self.assertRaises(TypeError):
+            -t
+
+        df = pd.DataFrame(
+            {"g": [1, 1, 2], "p": pd.Series([1.0, 3.0, 5.0], dtype="unit[bar]")}
+        )
+        sums = df.groupby("g")["p"].sum()
+        self.assertEqual(sums.dtype, usa.UnitDtype("bar"))
+        self.assertTrue(np.allclose(sums.to_numpy(), [4.0, 5.0]))
+        self.assertTrue(np.allclose(df.groupby("g")["p"].mean().to_numpy(), [2, 5]))
+        with self.assertRaises(TypeError):
+            df.groupby("g")["p"].prod()
+
+        # Rows in NA groups are dropped and empty categories kept
+        df["g"] = pd.Categorical(["a", None, "c"], categories=["a", "b", "c"])
+        grouped = df.groupby("g", observed=False)["p"]
+        self.assertTrue(np.allclose(grouped.sum().to_numpy(), [1.0, 0.0, 5.0]))
+        self.assertTrue(np.isnan(grouped.max().array._data[1]))
+        cummax = grouped.cummax().to_numpy()
+        self.assertTrue(np.isnan(cummax[1]) and cummax[2] == 5.0)
+        self.assertTrue(np.allclose(grouped.rank(), [1.0, np.nan, 1.0], equal_nan=True))
+
+
+if __name__ == "__main__":
+    unittest.main()